@@ -1,11 +1,42 @@
+import time
+
+_SCRIPT_START = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
+import atexit
 import datetime
+import hashlib
+import heapq
+import logging
+import os
+import pickle
 import random
-import time
+import re
 import json
+import queue
+import struct
+import threading
+import uuid
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import List, Dict, Optional
 
+import advocate_aggregation
+
+# Heavy dependencies (pandas, plotly, ...) are imported inside the views that
+# need them so that opening the sidebar or the chat never pays for them.
+
+logger = logging.getLogger("advocate")
+
+# Startup budget in seconds. "import" is the cold import of streamlit and the
+# modules above in a fresh interpreter, which only tests/test_startup.py can
+# measure; "first_paint" is checked on the first run of every session.
+STARTUP_BUDGET = {
+    "import": float(os.environ.get("ADVOCATE_IMPORT_BUDGET", "1.0")),
+    "first_paint": float(os.environ.get("ADVOCATE_FIRST_PAINT_BUDGET", "0.75")),
+}
+
 # Initialize session state
 if 'advocacy_cases' not in st.session_state:
     st.session_state.advocacy_cases = []
@@ -162,6 +193,31 @@ class HumanAdvocacyCase:
         self.success_stories = []
         self.assigned_advocate = ""
         self.resolution = ""
+        self.violation_id = ""  # reported violation this case was opened for
+        self.version = 0  # bumped on every mutation; keys cached renderings
+    
+    def touch(self):
+        self.version += 1
+        self.updated_at = datetime.datetime.now()
+    
+    def set_status(self, status: str):
+        if status != self.status:
+            self.status = status
+            self.touch()
+    
+    def add_action(self, action: str):
+        self.advocacy_actions.append(action)
+        self.touch()
+    
+    def assign(self, advocate: str):
+        self.assigned_advocate = advocate
+        self.touch()
+    
+    def resolve(self, resolution: str):
+        self.resolution = resolution
+        if resolution:
+            self.status = "resolved"
+        self.touch()
         
     def to_dict(self):
         return {
@@ -218,146 +274,1272 @@ AI_SYSTEMS = [
     "Surveillance Systems"
 ]
 
-# Advocacy Actions Database
-ADVOCACY_ACTIONS = {
-    "Legal": [
-        "File human rights complaint with UN",
-        "Initiate class action lawsuit",
-        "Submit to national human rights commission",
-        "Request judicial review",
-        "File amicus curiae brief"
-    ],
-    "Policy": [
-        "Draft legislation for AI regulation",
-        "Propose ethical AI guidelines",
-        "Lobby for algorithmic accountability laws",
-        "Advocate for AI impact assessments",
-        "Push for transparency requirements"
+# Reference Data
+# Loaded on first use by the views that need it and shared across reruns and
+# sessions, instead of being rebuilt on every script run.
+@st.cache_resource(show_spinner=False)
+def load_reference_data() -> Dict:
+    # Advocacy Actions Database
+    advocacy_actions = {
+        "Legal": [
+            "File human rights complaint with UN",
+            "Initiate class action lawsuit",
+            "Submit to national human rights commission",
+            "Request judicial review",
+            "File amicus curiae brief"
+        ],
+        "Policy": [
+            "Draft legislation for AI regulation",
+            "Propose ethical AI guidelines",
+            "Lobby for algorithmic accountability laws",
+            "Advocate for AI impact assessments",
+            "Push for transparency requirements"
+        ],
+        "Public Awareness": [
+            "Launch public awareness campaign",
+            "Organize community workshops",
+            "Create educational materials",
+            "Host public forums",
+            "Develop media partnerships"
+        ],
+        "Technical": [
+            "Develop bias detection tools",
+            "Create algorithmic auditing framework",
+            "Design privacy-preserving alternatives",
+            "Build explainable AI interfaces",
+            "Create human-centered design guidelines"
+        ],
+        "Corporate Engagement": [
+            "Demand algorithmic transparency reports",
+            "Request human rights impact assessments",
+            "Propose ethical review boards",
+            "Advocate for user consent mechanisms",
+            "Push for grievance redressal systems"
+        ]
+    }
+
+    # Success Stories Database
+    success_stories = [
+        {
+            "title": "Banned Discriminatory Hiring AI",
+            "description": "Successfully advocated for removal of biased AI that discriminated against women in tech hiring",
+            "people_impacted": "5000+ job seekers",
+            "year": 2023
+        },
+        {
+            "title": "Transparency in Facial Recognition",
+            "description": "Forced government to disclose facial recognition usage in public spaces",
+            "people_impacted": "2 million citizens",
+            "year": 2022
+        },
+        {
+            "title": "Healthcare AI Accountability",
+            "description": "Established oversight committee for medical diagnostic AI systems",
+            "people_impacted": "Healthcare patients nationwide",
+            "year": 2023
+        }
+    ]
+
+    # Resource Library
+    resources = {
+        "Legal Templates": [
+            "Human Rights Complaint Template",
+            "Algorithmic Impact Assessment Guide",
+            "Transparency Request Letter",
+            "Legal Demand Letter"
+        ],
+        "Policy Tools": [
+            "AI Regulation Framework",
+            "Ethical Guidelines Checklist",
+            "Stakeholder Engagement Plan",
+            "Impact Assessment Methodology"
+        ],
+        "Community Tools": [
+            "Public Awareness Campaign Kit",
+            "Community Workshop Guide",
+            "Social Media Toolkit",
+            "Petition Template"
+        ],
+        "Technical Resources": [
+            "Bias Detection Framework",
+            "Privacy Impact Assessment",
+            "Algorithmic Audit Guide",
+            "Human-Centered Design Principles"
+        ]
+    }
+
+    # International Frameworks
+    frameworks = [
+        "UN Guiding Principles on Business & Human Rights",
+        "OECD AI Principles",
+        "EU AI Act Guidelines",
+        "Universal Declaration of Human Rights"
+    ]
+
+    return {
+        "advocacy_actions": advocacy_actions,
+        "success_stories": success_stories,
+        "resources": resources,
+        "frameworks": frameworks
+    }
+
+# Strategy Recommender
+# Hand-tuned category preferences, used as a prior until resolved cases
+# provide evidence for a (right, AI system) pair.
+STRATEGY_PRIORS = {
+    "Right to Privacy": ["Legal", "Policy", "Public Awareness"],
+    "Right to Non-discrimination": ["Legal", "Technical", "Corporate Engagement"],
+    "Right to Freedom of Expression": ["Policy", "Public Awareness", "Corporate Engagement"],
+    "Right to Health": ["Policy", "Technical", "Corporate Engagement"]
+}
+DEFAULT_STRATEGY_PRIOR = ["Legal", "Policy"]
+PRIOR_WEIGHT = 3.0
+# Share of evidence from the same right or the same AI system that carries
+# over to pairs with little history of their own.
+BACKOFF_WEIGHT = 0.25
+
+class StrategyRecommender:
+    def __init__(self, advocacy_actions: Dict[str, List[str]]):
+        import numpy as np
+        
+        self.catalogue = [(category, action)
+                          for category, actions in advocacy_actions.items()
+                          for action in actions]
+        self.action_index = {action: i for i, (_, action) in enumerate(self.catalogue)}
+        self.right_index = {right: i for i, right in enumerate(HUMAN_RIGHTS)}
+        self.system_index = {system: i for i, system in enumerate(AI_SYSTEMS)}
+        
+        # prior[right, action]
+        self.prior = np.zeros((len(HUMAN_RIGHTS), len(self.catalogue)))
+        for right, r in self.right_index.items():
+            categories = STRATEGY_PRIORS.get(right, DEFAULT_STRATEGY_PRIOR)
+            for rank, category in enumerate(categories):
+                columns = [a for a, (cat, _) in enumerate(self.catalogue) if cat == category]
+                self.prior[r, columns] = PRIOR_WEIGHT * (len(categories) - rank) / len(categories)
+        
+        # evidence[right, system, action]: impact-weighted count of actions
+        # taken on cases that were later resolved
+        self.evidence = np.zeros((len(HUMAN_RIGHTS), len(AI_SYSTEMS), len(self.catalogue)))
+        self.scores = np.repeat(self.prior[:, None, :], len(AI_SYSTEMS), axis=1)
+        self.observed = {}  # case id -> action columns currently counted as evidence
+        self.updates = 0
+    
+    def observe(self, case: "HumanAdvocacyCase"):
+        # Bring the matrix in line with the case: a resolved case counts all
+        # of its actions, any other status counts none. Only the difference
+        # from what was counted before is applied.
+        import numpy as np
+        
+        r = self.right_index.get(case.human_right_affected)
+        s = self.system_index.get(case.ai_system)
+        if r is None or s is None:
+            return
+        current = set()
+        if case.status == "resolved":
+            current = {self.action_index[a] for a in case.advocacy_actions if a in self.action_index}
+        previous = self.observed.get(case.id, set())
+        if current == previous:
+            return
+        
+        weight = np.log1p(case.people_affected)
+        self._apply(r, s, sorted(current - previous), weight)
+        self._apply(r, s, sorted(previous - current), -weight)
+        if current:
+            self.observed[case.id] = current
+        else:
+            del self.observed[case.id]
+        self.updates += 1
+    
+    def _apply(self, r: int, s: int, actions: List[int], weight: float):
+        if not actions:
+            return
+        self.evidence[r, s, actions] += weight
+        self.scores[r, s, actions] += weight
+        self.scores[r, :, actions] += BACKOFF_WEIGHT * weight
+        self.scores[:, s, actions] += BACKOFF_WEIGHT * weight
+    
+    def recommend(self, right: str, ai_system: str) -> List[tuple]:
+        # Full catalogue as (category, action, score), best first
+        import numpy as np
+        
+        r = self.right_index[right]
+        s = self.system_index[ai_system]
+        row = self.scores[r, s]
+        order = np.argsort(-row, kind="stable")
+        return [(*self.catalogue[a], float(row[a])) for a in order]
+
+def get_strategy_recommender() -> StrategyRecommender:
+    # Built from the session's case history on first use, then kept up to
+    # date by record_case_update
+    if 'strategy_recommender' not in st.session_state:
+        recommender = StrategyRecommender(load_reference_data()["advocacy_actions"])
+        for case in st.session_state.advocacy_cases:
+            recommender.observe(case)
+        st.session_state.strategy_recommender = recommender
+    return st.session_state.strategy_recommender
+
+def record_case_update(case: "HumanAdvocacyCase"):
+    if 'strategy_recommender' in st.session_state:
+        st.session_state.strategy_recommender.observe(case)
+    if case.violation_id:
+        store = get_ingestion_pipeline().store
+        if case.status == "resolved":
+            store.resolve_violation(case.violation_id, case.id)
+        else:
+            store.reopen_violation(case.violation_id, case.id)
+
+# Document Generation
+# Plans and resource templates are rendered off the script thread by a small
+# shared worker pool. Results are cached by a digest of their inputs, so an
+# unchanged document is served without being rendered again.
+DOCUMENT_FORMATS = {
+    "Markdown": ("md", "text/markdown"),
+    "HTML": ("html", "text/html"),
+    "PDF": ("pdf", "application/pdf")
+}
+DOCUMENT_TEMPLATE_VERSION = 1
+DOCUMENT_WORKERS = int(os.environ.get("ADVOCATE_DOCUMENT_WORKERS", "2"))
+DOCUMENT_CACHE_SIZE = 256
+DOCUMENT_POLL_INTERVAL = 1.0
+DOCUMENT_JOBS_SHOWN = 5
+# Context keys that describe when a document was made rather than what is
+# in it; they are left out of the cache key
+DOCUMENT_VOLATILE_KEYS = ("prepared",)
+
+# Sections for each resource library category, filled from case data
+RESOURCE_TEMPLATES = {
+    "Legal Templates": [
+        ("Parties", "Complainant: [Name / Organisation]\nRespondent: Operator of the {ai_system} system"),
+        ("Right Affected", "{human_right} ({severity} severity, {people_affected} people affected)"),
+        ("Facts", "{description}"),
+        ("Relief Sought", "- Suspension of the {ai_system} system pending review\n- Disclosure of the system's decision criteria\n- Remedy for affected individuals")
     ],
-    "Public Awareness": [
-        "Launch public awareness campaign",
-        "Organize community workshops",
-        "Create educational materials",
-        "Host public forums",
-        "Develop media partnerships"
+    "Policy Tools": [
+        ("Problem Statement", "{ai_system} deployments are affecting the {human_right}. {description}"),
+        ("Stakeholders", "- Affected communities\n- System operators\n- Regulators and oversight bodies"),
+        ("Proposed Measures", "- Mandatory impact assessments before deployment\n- Transparency and audit requirements\n- Accessible grievance mechanisms")
     ],
-    "Technical": [
-        "Develop bias detection tools",
-        "Create algorithmic auditing framework",
-        "Design privacy-preserving alternatives",
-        "Build explainable AI interfaces",
-        "Create human-centered design guidelines"
+    "Community Tools": [
+        ("Why This Matters", "{ai_system} systems are affecting the {human_right} of about {people_affected} people."),
+        ("Key Messages", "- Everyone has the {human_right}\n- Automated systems must be accountable\n- Affected people deserve a say"),
+        ("How To Get Involved", "- Share your experience\n- Attend a community workshop\n- Sign and share the petition")
     ],
-    "Corporate Engagement": [
-        "Demand algorithmic transparency reports",
-        "Request human rights impact assessments",
-        "Propose ethical review boards",
-        "Advocate for user consent mechanisms",
-        "Push for grievance redressal systems"
+    "Technical Resources": [
+        ("System Under Review", "{ai_system} (case {case_id}: {case_title})"),
+        ("Rights At Risk", "{human_right}"),
+        ("Assessment Steps", "1. Document the system's inputs, outputs and decision points\n2. Measure outcomes across affected groups\n3. Identify less intrusive alternatives\n4. Record findings and remediation owners")
     ]
 }
 
-# Success Stories Database
-SUCCESS_STORIES = [
-    {
-        "title": "Banned Discriminatory Hiring AI",
-        "description": "Successfully advocated for removal of biased AI that discriminated against women in tech hiring",
-        "people_impacted": "5000+ job seekers",
-        "year": 2023
-    },
-    {
-        "title": "Transparency in Facial Recognition",
-        "description": "Forced government to disclose facial recognition usage in public spaces",
-        "people_impacted": "2 million citizens",
-        "year": 2022
-    },
-    {
-        "title": "Healthcare AI Accountability",
-        "description": "Established oversight committee for medical diagnostic AI systems",
-        "people_impacted": "Healthcare patients nationwide",
-        "year": 2023
+# Placeholders used when a template is generated without a case
+BLANK_CASE_CONTEXT = {
+    "case_id": "[Case ID]",
+    "case_title": "[Case Title]",
+    "description": "[Describe what happened, when, and who was affected.]",
+    "human_right": "[Human Right]",
+    "ai_system": "[AI System]",
+    "severity": "[Severity]",
+    "status": "[Status]",
+    "people_affected": "[Number]",
+    "assigned_advocate": "[Advocate]",
+    "advocacy_actions": [],
+    "resolution": ""
+}
+
+def case_context(case: Optional["HumanAdvocacyCase"]) -> Dict:
+    # Plain-data copy of a case, safe to hand to a worker thread
+    if case is None:
+        return dict(BLANK_CASE_CONTEXT)
+    return {
+        "case_id": case.id,
+        "case_title": case.title,
+        "description": case.description,
+        "human_right": case.human_right_affected,
+        "ai_system": case.ai_system,
+        "severity": case.severity,
+        "status": case.status,
+        "people_affected": f"{case.people_affected:,}",
+        "assigned_advocate": case.assigned_advocate or "Unassigned",
+        "advocacy_actions": list(case.advocacy_actions),
+        "resolution": case.resolution
     }
-]
 
-# Sidebar
-with st.sidebar:
-    st.markdown('<div class="human-card">', unsafe_allow_html=True)
-    st.title("🤝 Human AI Advocate")
-    st.markdown("Protecting human dignity in the age of AI")
-    st.markdown('</div>', unsafe_allow_html=True)
+def render_plan_markdown(context: Dict) -> str:
+    lines = [
+        f"# Advocacy Plan: {context['human_right']} and {context['ai_system']}",
+        "",
+        f"Prepared: {context['prepared']}",
+        "",
+        "## Objective",
+        "",
+        f"Protect the {context['human_right']} of people affected by {context['ai_system']} systems.",
+        "",
+        "## Recommended Actions",
+        ""
+    ]
+    for idx, (category, action, score) in enumerate(context["recommended"], start=1):
+        lines.append(f"{idx}. {action} ({category}, score {score:.2f})")
     
-    st.markdown("---")
+    lines += ["", "## Selected Actions", ""]
+    lines += [f"- {action}" for action in context["selected"]] or ["- None selected yet"]
     
-    # Quick Stats
-    st.subheader("📊 Human Impact Stats")
+    lines += ["", "## Related Cases", ""]
+    for case in context["cases"]:
+        lines.append(f"- {case['case_id']}: {case['case_title']} ({case['severity']}, "
+                     f"{case['people_affected']} people affected, {case['status']})")
+    if not context["cases"]:
+        lines.append("- No related cases on record")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Cases Active", len(st.session_state.advocacy_cases))
-    with col2:
-        st.metric("People Protected", st.session_state.impact_metrics['people_protected'])
+    lines += [
+        "",
+        "## Next Steps",
+        "",
+        "- Assign an advocate to each action",
+        "- Collect evidence from affected communities",
+        "- Track progress in the Impact Tracker"
+    ]
+    return "\n".join(lines) + "\n"
+
+def render_resource_markdown(context: Dict) -> str:
+    case = context["case"]
+    lines = [f"# {context['item']}", "", f"Category: {context['category']}", ""]
+    for heading, body in RESOURCE_TEMPLATES.get(context["category"], []):
+        lines += [f"## {heading}", "", body.format(**case), ""]
+    if case["advocacy_actions"]:
+        lines += ["## Actions Taken So Far", ""]
+        lines += [f"- {action}" for action in case["advocacy_actions"]] + [""]
+    return "\n".join(lines)
+
+DOCUMENT_TEMPLATES = {
+    "advocacy_plan": render_plan_markdown,
+    "resource": render_resource_markdown
+}
+
+def markdown_to_html(markdown_text: str, title: str) -> str:
+    # Handles the subset of Markdown produced by the templates above
+    import html
     
-    st.markdown("---")
+    body, list_tag = [], None
+    for raw in markdown_text.splitlines():
+        line = raw.strip()
+        item_tag = "ul" if line.startswith("- ") else "ol" if line[:1].isdigit() and ". " in line[:4] else None
+        if list_tag and item_tag != list_tag:
+            body.append(f"</{list_tag}>")
+            list_tag = None
+        if not line:
+            continue
+        if line.startswith("#"):
+            level = min(len(line) - len(line.lstrip("#")), 6)
+            body.append(f"<h{level}>{html.escape(line.lstrip('#').strip())}</h{level}>")
+        elif item_tag:
+            if not list_tag:
+                body.append(f"<{item_tag}>")
+                list_tag = item_tag
+            body.append(f"<li>{html.escape(line.split(' ', 1)[1])}</li>")
+        else:
+            body.append(f"<p>{html.escape(line)}</p>")
+    if list_tag:
+        body.append(f"</{list_tag}>")
     
-    # Report New Issue
-    st.subheader("🚨 Report New Issue")
+    return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>"
+            "<style>body{font-family:sans-serif;max-width:800px;margin:40px auto;line-height:1.5}"
+            "h1{color:#1a73e8}</style></head>\n<body>\n" + "\n".join(body) + "\n</body></html>\n")
+
+def markdown_to_pdf(markdown_text: str) -> bytes:
+    # Minimal single-column PDF using the built-in Helvetica fonts, so no
+    # PDF library is required. Characters outside Latin-1 are dropped.
+    import textwrap
     
-    if st.button("📝 Report Human Rights Violation", use_container_width=True):
-        st.session_state.reporting_mode = True
-        st.rerun()
+    page_width, page_height, margin = 612, 792, 54
+    lines = []
+    for raw in markdown_text.splitlines():
+        if raw.startswith("#"):
+            level = len(raw) - len(raw.lstrip("#"))
+            lines.append(("F2", 16 if level == 1 else 12, raw.lstrip("#").strip()))
+        else:
+            indent = "   " if raw.startswith("- ") or raw[:1].isdigit() else ""
+            for chunk in textwrap.wrap(raw, 95, subsequent_indent=indent) or [""]:
+                lines.append(("F1", 10, chunk))
     
-    if st.button("🆕 Generate Test Case", use_container_width=True):
-        # Generate a test case
-        case_id = f"HUM-{len(st.session_state.advocacy_cases) + 1000}"
-        rights = random.choice(HUMAN_RIGHTS)
-        systems = random.choice(AI_SYSTEMS)
+    pages, y = [[]], page_height - margin
+    for font, size, text in lines:
+        y -= size * 1.4
+        if y < margin:
+            pages.append([])
+            y = page_height - margin - size * 1.4
+        pages[-1].append((font, size, y, text))
+    
+    def pdf_string(text):
+        text = text.encode("latin-1", "ignore").decode("latin-1")
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    
+    # Objects: 1 catalog, 2 page tree, 3-4 fonts, then a page and its
+    # content stream for every page
+    page_ids = [5 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{p} 0 R' for p in page_ids)}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>"
+    ]
+    for page_id, page in zip(page_ids, pages):
+        stream = "".join(f"BT /{font} {size} Tf {margin} {y:.1f} Td ({pdf_string(text)}) Tj ET\n"
+                         for font, size, y, text in page).encode("latin-1")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] "
+                       f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> "
+                       f"/Contents {page_id + 1} 0 R >>".encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"endstream")
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+class DocumentJob:
+    def __init__(self, title: str, doc_format: str, digest: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.title = title
+        self.format = doc_format
+        self.digest = digest
+        self.status = "queued"  # "queued", "running", "done", "failed"
+        self.progress = 0.0
+        self.content: Optional[bytes] = None
+        self.error = ""
+        self.cached = False
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+    
+    @property
+    def file_name(self) -> str:
+        slug = "".join(ch if ch.isalnum() else "-" for ch in self.title.lower()).strip("-")
+        return f"{slug}.{DOCUMENT_FORMATS[self.format][0]}"
+
+class DocumentGenerator:
+    def __init__(self, max_workers: int = DOCUMENT_WORKERS, cache_size: int = DOCUMENT_CACHE_SIZE):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="advocate-documents")
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # digest -> rendered bytes
+        self._in_flight = {}  # digest -> DocumentJob
+        self._cache_size = cache_size
+    
+    @staticmethod
+    def digest(template: str, doc_format: str, context: Dict) -> str:
+        content = {key: value for key, value in context.items() if key not in DOCUMENT_VOLATILE_KEYS}
+        payload = json.dumps([DOCUMENT_TEMPLATE_VERSION, template, doc_format, content],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def submit(self, template: str, doc_format: str, title: str, context: Dict) -> DocumentJob:
+        digest = self.digest(template, doc_format, context)
+        with self._lock:
+            if digest in self._cache:
+                self._cache.move_to_end(digest)
+                job = DocumentJob(title, doc_format, digest)
+                job.content = self._cache[digest]
+                job.status, job.progress, job.cached = "done", 1.0, True
+                return job
+            if digest in self._in_flight:
+                return self._in_flight[digest]
+            job = DocumentJob(title, doc_format, digest)
+            self._in_flight[digest] = job
         
-        test_cases = [
-            f"Discriminatory {systems} affecting {rights}",
-            f"Privacy violation by {systems}",
-            f"Lack of transparency in {systems} impacting {rights}",
-            f"Algorithmic bias in {systems} violating {rights}"
-        ]
+        self._executor.submit(self._render, job, template, context)
+        return job
+    
+    def _render(self, job: DocumentJob, template: str, context: Dict):
+        try:
+            job.status = "running"
+            markdown_text = DOCUMENT_TEMPLATES[template](context)
+            job.progress = 0.4
+            
+            if job.format == "HTML":
+                content = markdown_to_html(markdown_text, job.title).encode("utf-8")
+            elif job.format == "PDF":
+                content = markdown_to_pdf(markdown_text)
+            else:
+                content = markdown_text.encode("utf-8")
+            job.progress = 0.9
+            
+            with self._lock:
+                self._cache[job.digest] = content
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            job.content = content
+            job.progress, job.status = 1.0, "done"
+        except Exception as exc:
+            logger.exception("Document generation failed for %s", job.title)
+            job.error, job.status = str(exc), "failed"
+        finally:
+            with self._lock:
+                self._in_flight.pop(job.digest, None)
+
+@st.cache_resource(show_spinner=False)
+def get_document_generator() -> DocumentGenerator:
+    return DocumentGenerator()
+
+def queue_document(template: str, doc_format: str, title: str, context: Dict) -> DocumentJob:
+    job = get_document_generator().submit(template, doc_format, title, context)
+    # A repeated request while the first is still rendering shares its job;
+    # list it once, as the newest
+    jobs = [j for j in st.session_state.get('document_jobs', []) if j is not job] + [job]
+    # Keep the finished jobs that are still shown, plus anything in progress,
+    # so rendered documents do not pile up in session state
+    shown = jobs[-DOCUMENT_JOBS_SHOWN:]
+    st.session_state.document_jobs = [j for j in jobs[:-DOCUMENT_JOBS_SHOWN] if not j.finished] + shown
+    return job
+
+def render_document_jobs():
+    jobs = st.session_state.get('document_jobs', [])
+    if not jobs:
+        return
+    
+    # Poll only while something is still rendering; the fragment reruns on
+    # its own without re-executing the rest of the page
+    polling = any(not job.finished for job in jobs)
+    
+    @st.fragment(run_every=DOCUMENT_POLL_INTERVAL if polling else None)
+    def document_jobs_panel():
+        for job in reversed(jobs[-DOCUMENT_JOBS_SHOWN:]):
+            label = f"{job.title} ({job.format})"
+            if job.status == "done":
+                st.download_button(f"⬇️ {label}" + (" · cached" if job.cached else ""),
+                                   data=job.content, file_name=job.file_name,
+                                   mime=DOCUMENT_FORMATS[job.format][1],
+                                   key=f"doc_{job.id}", on_click="ignore")
+            elif job.status == "failed":
+                st.error(f"{label} failed: {job.error}")
+            else:
+                st.progress(job.progress, text=f"Generating {label}...")
         
-        new_case = HumanAdvocacyCase(
-            case_id=case_id,
-            title=random.choice(test_cases),
-            description=f"Documented case where {systems} system is negatively impacting {rights}. Evidence shows systematic violation affecting vulnerable populations.",
-            human_right_affected=rights,
-            ai_system=systems,
-            severity=random.choice(["critical", "high", "medium", "low"])
-        )
+        if polling and all(job.finished for job in jobs):
+            st.rerun()
+    
+    document_jobs_panel()
+
+# Violation Ingestion
+# A reader thread tails a local drop directory and a writer thread batches
+# validated reports into the shared ViolationStore. The bounded queue between
+# them provides backpressure: a burst of reports stalls the reader, never a
+# user session, which only takes the store lock long enough to copy the feed.
+# A file is only read once it has not been modified for INGEST_QUIET_PERIOD
+# seconds, so a report that is still being written is not cut off and lost.
+VIOLATION_FEED_DIR = os.environ.get("ADVOCATE_FEED_DIR", "violation_feed")
+EVIDENCE_LEVELS = ["documented", "suspected", "verified"]
+VIOLATION_STATUSES = ["active", "resolved"]
+INGEST_POLL_INTERVAL = 2.0
+INGEST_QUIET_PERIOD = 5.0
+INGEST_QUEUE_SIZE = 1000
+INGEST_BATCH_SIZE = 200
+INGEST_BATCH_WAIT = 0.25
+FEED_BUFFER_SIZE = 50
+
+def parse_violation_report(record: Dict) -> HumanRightsViolation:
+    if not isinstance(record, dict):
+        raise ValueError("report must be a JSON object")
+    
+    right = record.get("right")
+    if right not in HUMAN_RIGHTS:
+        raise ValueError(f"unknown human right: {right!r}")
+    # Cases generated from a report copy its AI system into their title
+    ai_system = record.get("ai_system")
+    if ai_system not in AI_SYSTEMS:
+        raise ValueError(f"unknown AI system: {ai_system!r}")
+    evidence_level = record.get("evidence_level", "suspected")
+    if evidence_level not in EVIDENCE_LEVELS:
+        raise ValueError(f"unknown evidence level: {evidence_level!r}")
+    fields = {}
+    for name in ("description", "region"):
+        value = record.get(name)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"missing {name}")
+        fields[name] = value.strip()
+    
+    violation = HumanRightsViolation(
+        violation_id=str(record.get("id") or f"VIO-{uuid.uuid4().hex[:8].upper()}"),
+        right=right,
+        ai_system=ai_system,
+        description=fields["description"],
+        region=fields["region"],
+        evidence_level=evidence_level
+    )
+    if record.get("reported_date"):
+        reported_date = datetime.datetime.fromisoformat(record["reported_date"])
+        if reported_date.tzinfo is not None:
+            # Stored naive in local time, like datetime.now() elsewhere
+            reported_date = reported_date.astimezone().replace(tzinfo=None)
+        try:
+            # The region index buckets reports by timestamp
+            reported_date.timestamp()
+        except (OverflowError, OSError, ValueError):
+            raise ValueError(f"reported_date out of range: {record['reported_date']!r}")
+        violation.reported_date = reported_date
+    if record.get("status"):
+        if record["status"] not in VIOLATION_STATUSES:
+            raise ValueError(f"unknown status: {record['status']!r}")
+        violation.status = record["status"]
+    return violation
+
+# Regional Hotspots
+# Per-region counters are updated as violations arrive or are resolved, so
+# dashboard queries never scan the violation history. Report counts are kept
+# in fixed-width time buckets to answer sliding-window hotspot queries.
+HOTSPOT_WINDOW = datetime.timedelta(hours=24)
+SUCCESS_RATE_NOTE = ("Advocacy Success Rate: of the region's violations that were opened as a case "
+                     "(via Generate Test Case), the share whose case has been resolved.")
+HOTSPOT_BUCKET_SECONDS = 300
+
+class RegionStats:
+    def __init__(self):
+        self.active = 0
+        self.active_rights = Counter()
+        self.linked = 0  # violations taken up by at least one case
+        self.resolved = 0  # linked violations whose case was resolved
+        self.buckets = Counter()  # time bucket -> reports
+
+class RegionIndex:
+    def __init__(self, window: datetime.timedelta = HOTSPOT_WINDOW,
+                 bucket_seconds: int = HOTSPOT_BUCKET_SECONDS):
+        self.regions = {}  # region -> RegionStats
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+    
+    def _bucket(self, moment: datetime.datetime) -> int:
+        return int(moment.timestamp() // self.bucket_seconds)
+    
+    def add(self, violation: HumanRightsViolation):
+        bucket = self._bucket(violation.reported_date)
+        stats = self.regions.setdefault(violation.region, RegionStats())
+        stats.buckets[bucket] += 1
+        if violation.status == "active":
+            stats.active += 1
+            stats.active_rights[violation.right] += 1
+    
+    def link(self, violation: HumanRightsViolation):
+        # Called when a violation gets its first related case
+        self.regions[violation.region].linked += 1
+    
+    def resolve(self, violation: HumanRightsViolation):
+        # Called when an active violation is closed by a resolved case
+        stats = self.regions[violation.region]
+        stats.active -= 1
+        stats.active_rights[violation.right] -= 1
+        if violation.related_cases:
+            stats.resolved += 1
+    
+    def reopen(self, violation: HumanRightsViolation):
+        # Reverses resolve() when the resolving case is reopened
+        stats = self.regions[violation.region]
+        stats.active += 1
+        stats.active_rights[violation.right] += 1
+        if violation.related_cases:
+            stats.resolved -= 1
+    
+    def _window_reports(self, stats: RegionStats, now: datetime.datetime) -> int:
+        cutoff = self._bucket(now - self.window)
+        for bucket in [b for b in stats.buckets if b < cutoff]:
+            del stats.buckets[bucket]
+        return sum(stats.buckets.values())
+    
+    def _row(self, region: str, stats: RegionStats) -> Dict:
+        most_affected = [right for right, count in stats.active_rights.most_common(1) if count > 0]
+        return {
+            "Region": region,
+            "Active Violations": stats.active,
+            "Most Affected Right": most_affected[0] if most_affected else "-",
+            "Advocacy Success Rate": f"{stats.resolved / stats.linked:.0%}" if stats.linked else "-"
+        }
+    
+    def hotspots(self, k: int, now: Optional[datetime.datetime] = None) -> List[Dict]:
+        # Top-k regions by reports inside the sliding window
+        now = now or datetime.datetime.now()
+        counts = [(self._window_reports(stats, now), stats.active, region)
+                  for region, stats in self.regions.items()]
+        top = heapq.nlargest(k, (entry for entry in counts if entry[0] > 0))
+        window_label = f"Reports ({self.window.total_seconds() / 3600:g}h)"
+        return [{**self._row(region, self.regions[region]), window_label: reports}
+                for reports, _, region in top]
+    
+    def summary(self) -> List[Dict]:
+        rows = [self._row(region, stats) for region, stats in self.regions.items()]
+        return sorted(rows, key=lambda row: row["Active Violations"], reverse=True)
+
+class ViolationStore:
+    def __init__(self, feed_size: int = FEED_BUFFER_SIZE):
+        self._lock = threading.Lock()
+        self.violations = {}  # id -> HumanRightsViolation, in arrival order
+        self.feed = deque(maxlen=feed_size)  # newest first
+        self.regions = RegionIndex()
+        self.resolved_by = {}  # violation id -> ids of resolved cases linked to it
+        self.ingested = 0
+        self.rejected = 0
+    
+    def add_batch(self, batch: List[HumanRightsViolation]) -> int:
+        added = 0
+        with self._lock:
+            for violation in batch:
+                if violation.id in self.violations:
+                    continue
+                # Indexed first, so a violation the index cannot take is not stored
+                self.regions.add(violation)
+                self.violations[violation.id] = violation
+                self.feed.appendleft(violation)
+                added += 1
+            self.ingested += added
+        return added
+    
+    def record_rejected(self, count: int):
+        with self._lock:
+            self.rejected += count
+    
+    def recent(self, limit: int = 10) -> List[HumanRightsViolation]:
+        with self._lock:
+            return list(self.feed)[:limit]
+    
+    def link_case(self, violation_id: str, case_id: str):
+        with self._lock:
+            violation = self.violations.get(violation_id)
+            if violation is None:
+                return
+            if not violation.related_cases:
+                self.regions.link(violation)
+            violation.related_cases.append(case_id)
+    
+    def resolve_violation(self, violation_id: str, case_id: str):
+        with self._lock:
+            violation = self.violations.get(violation_id)
+            if violation is None:
+                return
+            self.resolved_by.setdefault(violation_id, set()).add(case_id)
+            if violation.status == "active":
+                violation.status = "resolved"
+                self.regions.resolve(violation)
+    
+    def reopen_violation(self, violation_id: str, case_id: str):
+        # The violation becomes active again once no resolved case is left
+        # on it; violations reported as resolved by the feed are left alone
+        with self._lock:
+            resolvers = self.resolved_by.get(violation_id)
+            if not resolvers or case_id not in resolvers:
+                return
+            resolvers.discard(case_id)
+            if resolvers:
+                return
+            del self.resolved_by[violation_id]
+            violation = self.violations[violation_id]
+            if violation.status == "resolved":
+                violation.status = "active"
+                self.regions.reopen(violation)
+    
+    def hotspots(self, k: int = 6) -> List[Dict]:
+        with self._lock:
+            return self.regions.hotspots(k)
+    
+    def region_summary(self) -> List[Dict]:
+        with self._lock:
+            return self.regions.summary()
+
+class ViolationIngestionPipeline:
+    def __init__(self, store: ViolationStore, feed_dir: str = VIOLATION_FEED_DIR,
+                 queue_size: int = INGEST_QUEUE_SIZE, batch_size: int = INGEST_BATCH_SIZE,
+                 quiet_period: float = INGEST_QUIET_PERIOD):
+        self.store = store
+        self.feed_dir = feed_dir
+        self.batch_size = batch_size
+        self.quiet_period = quiet_period
+        self.queue = queue.Queue(maxsize=queue_size)
+        self._retired = set()  # files that could not be renamed after reading
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._tail_feed_dir, name="advocate-ingest-reader", daemon=True),
+            threading.Thread(target=self._write_batches, name="advocate-ingest-writer", daemon=True)
+        ]
+    
+    def start(self):
+        os.makedirs(self.feed_dir, exist_ok=True)
+        for thread in self._threads:
+            thread.start()
+    
+    def stop(self):
+        self._stop.set()
+    
+    def submit(self, record: Dict) -> bool:
+        # In-process producers never block; a full queue is reported back
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            return False
+    
+    def _enqueue(self, record: Dict) -> bool:
+        # Blocks while the queue is full, pausing the reader
+        while not self._stop.is_set():
+            try:
+                self.queue.put(record, timeout=INGEST_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _read_reports(self, path: str):
+        # Returns (records, bad lines). A .json file is parsed as a whole
+        # before anything is queued; a .jsonl file skips bad lines one by one
+        with open(path, encoding="utf-8") as handle:
+            if not path.endswith(".jsonl"):
+                data = json.load(handle)
+                return (data if isinstance(data, list) else [data]), 0
+            records, bad_lines = [], 0
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    bad_lines += 1
+            return records, bad_lines
+    
+    def _retire(self, name: str, suffix: str):
+        path = os.path.join(self.feed_dir, name)
+        try:
+            os.replace(path, path + suffix)
+        except OSError as exc:
+            # Never read the file again in this process, even if it stays put
+            logger.warning("Could not rename violation feed file %s: %s", name, exc)
+            self._retired.add(name)
+    
+    def _tail_feed_dir(self):
+        while not self._stop.is_set():
+            try:
+                names = sorted(name for name in os.listdir(self.feed_dir)
+                               if name.endswith((".json", ".jsonl")))
+            except OSError:
+                logger.exception("Cannot list violation feed directory %s", self.feed_dir)
+                names = []
+            
+            for name in names:
+                if name in self._retired:
+                    continue
+                path = os.path.join(self.feed_dir, name)
+                try:
+                    if time.time() - os.path.getmtime(path) < self.quiet_period:
+                        continue  # still being written; picked up on a later poll
+                except OSError:
+                    continue
+                try:
+                    records, bad_lines = self._read_reports(path)
+                except (OSError, ValueError) as exc:
+                    logger.warning("Rejected violation feed file %s: %s", name, exc)
+                    self.store.record_rejected(1)
+                    self._retire(name, ".rejected")
+                    continue
+                
+                if bad_lines:
+                    logger.warning("Skipped %d malformed lines in %s", bad_lines, name)
+                    self.store.record_rejected(bad_lines)
+                for record in records:
+                    if not self._enqueue(record):
+                        return
+                self._retire(name, ".done")
+            
+            self._stop.wait(INGEST_POLL_INTERVAL)
+    
+    def _write_batches(self):
+        while not self._stop.is_set():
+            try:
+                records = [self.queue.get(timeout=INGEST_POLL_INTERVAL)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + INGEST_BATCH_WAIT
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(records)
+            except Exception:
+                # The writer must outlive a bad batch, or the reader ends up
+                # blocked on a full queue
+                logger.exception("Dropped a batch of %d violation reports", len(records))
+                self.store.record_rejected(len(records))
+    
+    def _write_batch(self, records: List[Dict]):
+        batch, rejected = [], 0
+        for record in records:
+            try:
+                batch.append(parse_violation_report(record))
+            except (TypeError, ValueError) as exc:
+                logger.debug("Rejected violation report: %s", exc)
+                rejected += 1
+        self.store.add_batch(batch)
+        if rejected:
+            self.store.record_rejected(rejected)
+
+@st.cache_resource(show_spinner=False)
+def get_ingestion_pipeline() -> ViolationIngestionPipeline:
+    pipeline = ViolationIngestionPipeline(ViolationStore())
+    pipeline.start()
+    return pipeline
+
+def format_relative_time(moment: datetime.datetime) -> str:
+    seconds = (datetime.datetime.now() - moment).total_seconds()
+    if seconds < 60:
+        return "Just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        hours = int(seconds // 3600)
+        return f"{hours} hour{'s' if hours > 1 else ''} ago"
+    return moment.strftime("%Y-%m-%d")
+
+# Session Snapshots
+# Whenever a session's state changes, a plain-data copy is handed to a
+# background thread that pickles it (protocol 5, with numpy arrays passed as
+# out-of-band buffers) and writes the latest snapshot per session to disk.
+# After a restart or a reconnect to another server, the session's token in
+# the URL restores it on first run.
+#
+# SESSION_SNAPSHOT_DIR must be private to the app: snapshots are unpickled
+# on load, so anyone who can write a file there can run code in the server.
+# The URL token is a bearer credential for the session it names.
+SESSION_SNAPSHOT_DIR = os.environ.get("ADVOCATE_SNAPSHOT_DIR", "session_snapshots")
+SNAPSHOT_FLUSH_INTERVAL = 2.0
+SNAPSHOT_TTL = datetime.timedelta(hours=float(os.environ.get("ADVOCATE_SNAPSHOT_TTL_HOURS", "168")))
+SNAPSHOT_GC_INTERVAL = 600.0
+SNAPSHOT_MAGIC = b"HAADV\x01"
+SNAPSHOT_KEYS = ["advocacy_cases", "human_rights_violations", "impact_metrics",
+                 "chat_history", "selected_case", "strategy_recommender"]
+
+def plain_copy(item) -> Dict:
+    # Attribute dict with its lists copied, so the script thread can keep
+    # mutating the object while the copy is being pickled
+    return {name: list(value) if isinstance(value, list) else value
+            for name, value in item.__dict__.items()}
+
+def snapshot_state(session_state) -> Dict:
+    # Plain-data copy of the session, safe to hand to the writer thread.
+    # Model objects are stored as attribute dicts because classes defined by
+    # the script change identity each rerun. Case copies are reused until
+    # the case's version changes, so a change costs little beyond a lookup
+    # per case.
+    if "snapshot_case_copies" not in session_state:
+        session_state["snapshot_case_copies"] = {}  # case id -> (version, copy)
+    copies = session_state["snapshot_case_copies"]
+    state = {}
+    for key in SNAPSHOT_KEYS:
+        if key not in session_state:
+            continue
+        value = session_state[key]
+        if key == "advocacy_cases":
+            cases, value = value, []
+            for case in cases:
+                entry = copies.get(case.id)
+                if entry is None or entry[0] != case.version:
+                    entry = copies[case.id] = (case.version, plain_copy(case))
+                value.append(entry[1])
+        elif key == "human_rights_violations":
+            value = [plain_copy(item) for item in value]
+        elif key == "strategy_recommender":
+            value = {
+                "evidence": value.evidence.copy(),
+                "scores": value.scores.copy(),
+                "observed": {case_id: sorted(columns) for case_id, columns in value.observed.items()}
+            }
+        elif key == "impact_metrics":
+            value = dict(value)
+        elif key == "chat_history":
+            value = list(value)
+        state[key] = value
+    return state
+
+def restore_state(state: Dict) -> Dict:
+    restored = dict(state)
+    if "advocacy_cases" in state:
+        cases = []
+        for data in state["advocacy_cases"]:
+            case = HumanAdvocacyCase(data["id"], data["title"], data["description"],
+                                     data["human_right_affected"], data["ai_system"], data["severity"])
+            case.__dict__.update(data)
+            cases.append(case)
+        restored["advocacy_cases"] = cases
+    if "human_rights_violations" in state:
+        violations = []
+        for data in state["human_rights_violations"]:
+            violation = HumanRightsViolation(data["id"], data["right"], data["ai_system"],
+                                             data["description"], data["region"], data["evidence_level"])
+            violation.__dict__.update(data)
+            violations.append(violation)
+        restored["human_rights_violations"] = violations
+    if "strategy_recommender" in state:
+        # Rebuilt lazily from the cases instead if the catalogue has changed
+        saved = state["strategy_recommender"]
+        recommender = StrategyRecommender(load_reference_data()["advocacy_actions"])
+        del restored["strategy_recommender"]
+        if "observed" in saved and saved["scores"].shape == recommender.scores.shape:
+            recommender.evidence = saved["evidence"]
+            recommender.scores = saved["scores"]
+            recommender.observed = {case_id: set(columns) for case_id, columns in saved["observed"].items()}
+            restored["strategy_recommender"] = recommender
+    return restored
+
+def encode_snapshot(state: Dict) -> bytes:
+    # Layout: magic, buffer count, buffer lengths, pickle length, pickle,
+    # then the raw out-of-band buffers
+    buffers = []
+    payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    header = struct.pack(f"<I{len(raw_buffers)}QQ", len(raw_buffers),
+                         *(raw.nbytes for raw in raw_buffers), len(payload))
+    return b"".join([SNAPSHOT_MAGIC, header, payload, *raw_buffers])
+
+def decode_snapshot(data: bytearray) -> Dict:
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError("not a session snapshot")
+    view = memoryview(data)
+    offset = len(SNAPSHOT_MAGIC)
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    *buffer_sizes, payload_size = struct.unpack_from(f"<{count}QQ", data, offset)
+    offset += 8 * (count + 1)
+    payload = view[offset:offset + payload_size]
+    offset += payload_size
+    # Buffers are slices of the (writable) file contents, not copies
+    buffers = []
+    for size in buffer_sizes:
+        buffers.append(view[offset:offset + size])
+        offset += size
+    return pickle.loads(payload, buffers=buffers)
+
+class SessionSnapshotter:
+    def __init__(self, directory: str = SESSION_SNAPSHOT_DIR,
+                 flush_interval: float = SNAPSHOT_FLUSH_INTERVAL):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = {}  # token -> plain-data state, latest wins
+        self._digests = {}  # token -> digest of the last snapshot written
+        self._owners = {}  # token -> id of the session using it
+        self._flush_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="advocate-snapshots", daemon=True)
+    
+    def start(self):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        os.chmod(self.directory, 0o700)
+        self._thread.start()
+        atexit.register(self.flush)
+    
+    def path(self, token: str) -> str:
+        return os.path.join(self.directory, f"{token}.snapshot")
+    
+    def claim(self, token: str, session_id: str) -> bool:
+        # A token already in use by another connected session (a shared link
+        # or a duplicated tab) is refused, so two sessions never share a file
+        from streamlit import runtime
         
-        st.session_state.advocacy_cases.append(new_case)
-        st.success("Test case generated!")
-        st.rerun()
+        with self._lock:
+            owner = self._owners.get(token)
+            if owner and owner != session_id and runtime.exists() \
+                    and runtime.get_instance().is_active_session(owner):
+                return False
+            self._owners[token] = session_id
+            return True
     
-    st.markdown("---")
+    def save(self, token: str, state: Dict):
+        with self._lock:
+            self._pending[token] = state
     
-    # User Role
-    st.subheader("👤 Your Role")
-    user_role = st.selectbox(
-        "Select your advocacy role:",
-        ["Human Rights Advocate", "Legal Expert", "Policy Maker", 
-         "Affected Individual", "Researcher", "Concerned Citizen"]
+    def load(self, token: str) -> Optional[Dict]:
+        path = self.path(token)
+        try:
+            if time.time() - os.path.getmtime(path) > SNAPSHOT_TTL.total_seconds():
+                return None
+            with open(path, "rb") as handle:
+                data = bytearray(handle.read())
+        except FileNotFoundError:
+            return None
+        try:
+            return decode_snapshot(data)
+        except Exception:
+            logger.exception("Discarding unreadable session snapshot %s", token)
+            return None
+    
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for token, state in pending.items():
+                data = encode_snapshot(state)
+                digest = hashlib.blake2b(data, digest_size=16).digest()
+                if self._digests.get(token) == digest:
+                    continue
+                path = self.path(token)
+                try:
+                    fd = os.open(path + ".tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(data)
+                    os.replace(path + ".tmp", path)
+                    self._digests[token] = digest
+                except OSError:
+                    logger.exception("Could not write session snapshot %s", token)
+    
+    def collect_garbage(self):
+        # Drop snapshots (and bookkeeping) untouched for longer than the TTL
+        cutoff = time.time() - SNAPSHOT_TTL.total_seconds()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            logger.exception("Cannot list session snapshot directory %s", self.directory)
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            token = name.split(".", 1)[0]
+            with self._lock:
+                self._digests.pop(token, None)
+                self._owners.pop(token, None)
+    
+    def _run(self):
+        last_gc = 0.0
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+                if time.monotonic() - last_gc >= SNAPSHOT_GC_INTERVAL:
+                    self.collect_garbage()
+                    last_gc = time.monotonic()
+            except Exception:
+                logger.exception("Session snapshot writer failed")
+
+@st.cache_resource(show_spinner=False)
+def get_session_snapshotter() -> SessionSnapshotter:
+    snapshotter = SessionSnapshotter()
+    snapshotter.start()
+    return snapshotter
+
+def restore_session_snapshot():
+    # Runs once per session; a fresh session with a known token picks up
+    # where the previous connection left off, unless another live session
+    # is already using that token
+    if 'session_token' in st.session_state:
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    
+    snapshotter = get_session_snapshotter()
+    session_id = get_script_run_ctx().session_id
+    token = st.query_params.get("session", "")
+    if not re.fullmatch(r"[0-9a-f]{32}", token) or not snapshotter.claim(token, session_id):
+        token = uuid.uuid4().hex
+        snapshotter.claim(token, session_id)
+        st.query_params["session"] = token
+        st.session_state.session_token = token
+        return
+    
+    st.session_state.session_token = token
+    state = snapshotter.load(token)
+    if state:
+        for key, value in restore_state(state).items():
+            st.session_state[key] = value
+
+def snapshot_fingerprint(session_state) -> tuple:
+    # Cheap summary of the snapshotted keys; case mutations bump versions
+    cases = session_state.get("advocacy_cases", [])
+    recommender = session_state.get("strategy_recommender")
+    return (
+        len(cases),
+        sum(map(attrgetter("version"), cases)),
+        len(session_state.get("human_rights_violations", [])),
+        tuple(session_state.get("impact_metrics", {}).values()),
+        len(session_state.get("chat_history", [])),
+        session_state.get("selected_case"),
+        recommender.updates if recommender else -1
     )
+
+def snapshot_session():
+    # Encoding a large session is costly, so only do it when the fingerprint
+    # says something changed
+    fingerprint = snapshot_fingerprint(st.session_state)
+    if st.session_state.get('snapshot_fingerprint') == fingerprint:
+        return
+    st.session_state.snapshot_fingerprint = fingerprint
+    get_session_snapshotter().save(st.session_state.session_token, snapshot_state(st.session_state))
+
+# Sharded Aggregation
+# Impact Tracker totals come from advocate_aggregation, which reuses cached
+# per-shard partials; each session keeps its own shard cache.
+def aggregate_cases(cases: List[HumanAdvocacyCase]) -> Dict:
+    if 'aggregate_shard_cache' not in st.session_state:
+        st.session_state.aggregate_shard_cache = {}
+    return advocate_aggregation.aggregate_cases(cases, st.session_state.aggregate_shard_cache)
+
+# Startup Timing
+def record_startup_timings():
+    if 'startup_timings' in st.session_state:
+        return
     
-    st.info(f"Role: {user_role}")
+    # Measured from the start of this script run to the page header
+    first_paint = time.perf_counter() - _SCRIPT_START
+    st.session_state.startup_timings = {"first_paint": first_paint}
+    st.session_state.startup_budget = STARTUP_BUDGET
+    
+    if first_paint > STARTUP_BUDGET["first_paint"]:
+        logger.warning("First paint took %.3fs (budget %.3fs)",
+                       first_paint, STARTUP_BUDGET["first_paint"])
 
-# Main App
-st.markdown('<h1 style="text-align: center; color: #1a73e8;">🤝 Human AI Advocate Platform</h1>', unsafe_allow_html=True)
-st.markdown('<p style="text-align: center; font-size: 1.2rem;">Protecting Human Dignity in Artificial Intelligence Systems</p>', unsafe_allow_html=True)
+# Case Cards
+# Rendered card HTML is cached per session by case id together with the
+# version it was rendered from, so a rerun only formats cards for cases that
+# changed since they were last shown. There is one entry per case and a new
+# version replaces the old one, so the cache grows with the case list rather
+# than with edits, and a full list never evicts its own cards.
+SEVERITY_COLORS = {
+    "critical": "#d32f2f",
+    "high": "#f57c00",
+    "medium": "#1976d2",
+    "low": "#388e3c"
+}
 
-# Tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "🏠 Dashboard", 
-    "🔍 Cases", 
-    "⚖️ Advocacy Toolkit", 
-    "📈 Impact Tracker", 
-    "💬 Human-Centered AI Chat"
-])
+def render_case_card(case: HumanAdvocacyCase) -> str:
+    if 'case_card_cache' not in st.session_state:
+        st.session_state.case_card_cache = {}  # case id -> (version, html)
+    cache = st.session_state.case_card_cache
+    cached = cache.get(case.id)
+    if cached and cached[0] == case.version:
+        return cached[1]
+    
+    # Case text can come from users or the violation feed
+    import html
+    
+    color = SEVERITY_COLORS[case.severity]
+    card = f'''
+            <div style="border-left: 5px solid {color}; 
+                        padding: 15px; margin: 10px 0; background: white; border-radius: 5px;">
+                <h4>{html.escape(case.title)} <span style="color: {color}; 
+                    font-weight: bold;">[{case.severity.upper()}]</span></h4>
+                <p><strong>Human Right:</strong> {html.escape(case.human_right_affected)} | 
+                <strong>AI System:</strong> {html.escape(case.ai_system)}</p>
+                <p><strong>People Affected:</strong> {case.people_affected:,} | 
+                <strong>Status:</strong> {html.escape(case.status)}</p>
+                <p>{html.escape(case.description[:200])}...</p>
+            </div>
+            '''
+    cache[case.id] = (case.version, card)
+    return card
 
-with tab1:  # Dashboard
+# Views
+def render_dashboard():  # Dashboard
     st.subheader("🌍 Global Human Rights & AI Dashboard")
     
     # Real-time alerts
@@ -393,18 +1575,19 @@ with tab1:  # Dashboard
     # Current Hotspots
     st.subheader("🔥 Current Human Rights Hotspots")
     
-    hotspots_data = pd.DataFrame({
-        'Region': ['EU', 'USA', 'China', 'India', 'Brazil', 'Africa'],
-        'Active Cases': [12, 8, 15, 10, 7, 9],
-        'Most Affected Right': ['Privacy', 'Non-discrimination', 'Expression', 'Privacy', 'Work', 'Health']
-    })
+    pipeline = get_ingestion_pipeline()
+    hotspots_data = pipeline.store.hotspots()
     
-    st.dataframe(hotspots_data, use_container_width=True)
+    if hotspots_data:
+        st.dataframe(hotspots_data, use_container_width=True)
+        st.caption(SUCCESS_RATE_NOTE)
+    else:
+        st.caption("No violation reports in the current window.")
     
     # Success Stories
     st.subheader("🌟 Recent Success Stories")
     
-    for story in SUCCESS_STORIES[:2]:
+    for story in load_reference_data()["success_stories"][:2]:
         st.markdown(f'''
         <div class="success-story">
             <h4>✅ {story['title']}</h4>
@@ -416,17 +1599,20 @@ with tab1:  # Dashboard
     # Live Updates Feed
     st.subheader("🔄 Live Human Rights Updates")
     
-    updates = [
-        {"time": "Just now", "update": "New legislation proposed for AI transparency in healthcare"},
-        {"time": "5 min ago", "update": "Community forum organized on algorithmic bias"},
-        {"time": "1 hour ago", "update": "UN committee reviews AI human rights guidelines"},
-        {"time": "3 hours ago", "update": "Major tech company agrees to human rights audit"}
-    ]
+    updates = pipeline.store.recent(8)
     
-    for update in updates:
-        st.info(f"🕒 {update['time']}: {update['update']}")
+    for violation in updates:
+        st.info(f"🕒 {format_relative_time(violation.reported_date)}: [{violation.region}] "
+                f"{violation.right} affected by {violation.ai_system} - {violation.description}")
+    
+    if not updates:
+        st.caption(f"No violation reports yet. Drop JSON or JSON Lines reports into "
+                   f"`{pipeline.feed_dir}` to populate this feed; files are read once "
+                   f"they have been unchanged for {pipeline.quiet_period:g} seconds.")
+    st.caption(f"Ingested: {pipeline.store.ingested:,} | Rejected: {pipeline.store.rejected:,} | "
+               f"Queued: {pipeline.queue.qsize():,}")
 
-with tab2:  # Cases
+def render_cases(user_role: str):  # Cases
     st.subheader("📋 Human Rights Advocacy Cases")
     
     # Filters
@@ -450,26 +1636,7 @@ with tab2:  # Cases
     
     if filtered_cases:
         for case in filtered_cases:
-            # Determine color based on severity
-            severity_colors = {
-                "critical": "#d32f2f",
-                "high": "#f57c00",
-                "medium": "#1976d2",
-                "low": "#388e3c"
-            }
-            
-            st.markdown(f'''
-            <div style="border-left: 5px solid {severity_colors[case.severity]}; 
-                        padding: 15px; margin: 10px 0; background: white; border-radius: 5px;">
-                <h4>{case.title} <span style="color: {severity_colors[case.severity]}; 
-                    font-weight: bold;">[{case.severity.upper()}]</span></h4>
-                <p><strong>Human Right:</strong> {case.human_right_affected} | 
-                <strong>AI System:</strong> {case.ai_system}</p>
-                <p><strong>People Affected:</strong> {case.people_affected:,} | 
-                <strong>Status:</strong> {case.status}</p>
-                <p>{case.description[:200]}...</p>
-            </div>
-            ''', unsafe_allow_html=True)
+            st.markdown(render_case_card(case), unsafe_allow_html=True)
             
             col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 2])
             with col_btn1:
@@ -485,7 +1652,7 @@ with tab2:  # Cases
                     st.info(f"Assigned to: {case.assigned_advocate}")
                 else:
                     if st.button("👤 Take This Case", key=f"take_{case.id}"):
-                        case.assigned_advocate = user_role
+                        case.assign(user_role)
                         st.success(f"Case assigned to {user_role}!")
                         st.rerun()
     else:
@@ -533,16 +1700,19 @@ with tab2:  # Cases
                                          ["reported", "investigating", "advocating", "resolved"],
                                          index=["reported", "investigating", "advocating", "resolved"].index(case.status))
                 if new_status != case.status:
-                    case.status = new_status
+                    case.set_status(new_status)
+                    record_case_update(case)
                     st.success(f"Status updated to {new_status}")
                 
                 # Add Advocacy Action
                 st.markdown("##### Add Advocacy Action")
-                action_type = st.selectbox("Action Type", list(ADVOCACY_ACTIONS.keys()))
+                advocacy_actions = load_reference_data()["advocacy_actions"]
+                action_type = st.selectbox("Action Type", list(advocacy_actions.keys()))
                 if action_type:
-                    selected_action = st.selectbox("Select Action", ADVOCACY_ACTIONS[action_type])
+                    selected_action = st.selectbox("Select Action", advocacy_actions[action_type])
                     if st.button("Add Action"):
-                        case.advocacy_actions.append(selected_action)
+                        case.add_action(selected_action)
+                        record_case_update(case)
                         st.success(f"Added: {selected_action}")
                         
                         # Update metrics
@@ -555,15 +1725,17 @@ with tab2:  # Cases
                 st.markdown("##### Record Resolution")
                 resolution_text = st.text_area("Resolution details:", case.resolution)
                 if resolution_text != case.resolution:
-                    case.resolution = resolution_text
+                    case.resolve(resolution_text)
                     if resolution_text:
-                        case.status = "resolved"
+                        record_case_update(case)
                         st.session_state.impact_metrics['people_protected'] += case.people_affected
                 
                 if st.button("Save Resolution"):
                     st.success("Resolution saved!")
 
-with tab3:  # Advocacy Toolkit
+def render_advocacy_toolkit():  # Advocacy Toolkit
+    reference = load_reference_data()
+    
     st.subheader("⚖️ Human-Centered Advocacy Toolkit")
     
     col_tool1, col_tool2 = st.columns(2)
@@ -576,91 +1748,85 @@ with tab3:  # Advocacy Toolkit
         
         st.markdown("#### 📋 Recommended Actions")
         
-        # Generate recommended actions based on selection
-        recommendations = {
-            "Right to Privacy": ["Legal", "Policy", "Public Awareness"],
-            "Right to Non-discrimination": ["Legal", "Technical", "Corporate Engagement"],
-            "Right to Freedom of Expression": ["Policy", "Public Awareness", "Corporate Engagement"],
-            "Right to Health": ["Policy", "Technical", "Corporate Engagement"]
-        }
-        
-        rec_type = recommendations.get(target_right, ["Legal", "Policy"])
+        # Rank the whole catalogue for the selected right and AI system,
+        # grouping categories by their best-scoring action
+        ranked = get_strategy_recommender().recommend(target_right, target_ai)
+        by_category = {}
+        for category, action, score in ranked:
+            by_category.setdefault(category, []).append((action, score))
         
-        for action_type in rec_type[:2]:
-            with st.expander(f"{action_type} Actions"):
-                for action in ADVOCACY_ACTIONS[action_type]:
-                    if st.checkbox(action):
+        selected_actions = []
+        for rank, (action_type, actions) in enumerate(by_category.items()):
+            with st.expander(f"{action_type} Actions", expanded=rank < 2):
+                for action, score in actions:
+                    if st.checkbox(action, help=f"Recommendation score: {score:.2f}"):
                         st.info(f"Selected: {action}")
+                        selected_actions.append(action)
         
+        plan_format = st.selectbox("Plan format", list(DOCUMENT_FORMATS.keys()), key="plan_format")
         if st.button("📋 Generate Advocacy Plan"):
-            st.success(f"Advocacy plan generated for protecting {target_right} against {target_ai}!")
+            related_cases = [case_context(c) for c in st.session_state.advocacy_cases
+                             if c.human_right_affected == target_right or c.ai_system == target_ai]
+            queue_document("advocacy_plan", plan_format, f"Advocacy Plan - {target_right} - {target_ai}", {
+                "human_right": target_right,
+                "ai_system": target_ai,
+                "prepared": datetime.date.today().isoformat(),
+                "recommended": ranked[:5],
+                "selected": selected_actions,
+                "cases": related_cases
+            })
+            st.success(f"Generating advocacy plan for protecting {target_right} against {target_ai}...")
     
     with col_tool2:
         st.markdown("### 📚 Resource Library")
         
-        resources = {
-            "Legal Templates": [
-                "Human Rights Complaint Template",
-                "Algorithmic Impact Assessment Guide",
-                "Transparency Request Letter",
-                "Legal Demand Letter"
-            ],
-            "Policy Tools": [
-                "AI Regulation Framework",
-                "Ethical Guidelines Checklist",
-                "Stakeholder Engagement Plan",
-                "Impact Assessment Methodology"
-            ],
-            "Community Tools": [
-                "Public Awareness Campaign Kit",
-                "Community Workshop Guide",
-                "Social Media Toolkit",
-                "Petition Template"
-            ],
-            "Technical Resources": [
-                "Bias Detection Framework",
-                "Privacy Impact Assessment",
-                "Algorithmic Audit Guide",
-                "Human-Centered Design Principles"
-            ]
-        }
+        cases_by_id = {c.id: c for c in st.session_state.advocacy_cases}
+        template_case = st.selectbox("Fill templates from case:", [None] + list(cases_by_id.keys()),
+                                     format_func=lambda cid: "Blank template" if cid is None
+                                     else f"{cid}: {cases_by_id[cid].title}")
+        resource_format = st.selectbox("Template format", list(DOCUMENT_FORMATS.keys()), key="resource_format")
         
-        for category, items in resources.items():
+        for category, items in reference["resources"].items():
             with st.expander(f"📁 {category}"):
                 for item in items:
                     if st.button(f"📄 {item}", key=f"res_{item}"):
-                        st.info(f"Downloading {item}...")
+                        title = f"{item} - {template_case}" if template_case else item
+                        queue_document("resource", resource_format, title, {
+                            "item": item,
+                            "category": category,
+                            "case": case_context(cases_by_id.get(template_case))
+                        })
+                        st.info(f"Preparing {item}...")
         
         st.markdown("---")
         st.markdown("### 🌐 International Frameworks")
         
-        frameworks = [
-            "UN Guiding Principles on Business & Human Rights",
-            "OECD AI Principles",
-            "EU AI Act Guidelines",
-            "Universal Declaration of Human Rights"
-        ]
-        
-        for framework in frameworks:
+        for framework in reference["frameworks"]:
             st.write(f"• {framework}")
+    
+    if st.session_state.get('document_jobs'):
+        st.markdown("### 📄 Generated Documents")
+        render_document_jobs()
 
-with tab4:  # Impact Tracker
+def render_impact_tracker(user_role: str):  # Impact Tracker
+    import pandas as pd
+    
     st.subheader("📈 Human Impact Tracker")
     
     # Impact Visualization
     if st.session_state.advocacy_cases:
-        cases_df = pd.DataFrame([c.to_dict() for c in st.session_state.advocacy_cases])
+        aggregates = aggregate_cases(st.session_state.advocacy_cases)
         
         col_imp1, col_imp2 = st.columns(2)
         
         with col_imp1:
             st.markdown("### 👥 People Impacted by Right")
-            right_counts = cases_df.groupby('human_right')['people_affected'].sum().sort_values(ascending=False)
+            right_counts = pd.Series(aggregates["people_by_right"]).sort_values(ascending=False)
             st.bar_chart(right_counts)
         
         with col_imp2:
             st.markdown("### ⚖️ Cases by AI System")
-            system_counts = cases_df['ai_system'].value_counts()
+            system_counts = pd.Series(aggregates["cases_by_system"]).sort_values(ascending=False)
             st.bar_chart(system_counts)
         
         # Cumulative Impact
@@ -679,17 +1845,16 @@ with tab4:  # Impact Tracker
         # Success Metrics
         st.markdown("### 🎯 Your Advocacy Impact")
         
-        user_cases = [c for c in st.session_state.advocacy_cases if c.assigned_advocate == user_role]
+        user_totals = aggregates["advocates"].get(user_role)
         
-        if user_cases:
+        if user_totals:
+            user_case_count, total_impact, resolved = user_totals
             col_u1, col_u2, col_u3 = st.columns(3)
             with col_u1:
-                st.metric("Your Cases", len(user_cases))
+                st.metric("Your Cases", user_case_count)
             with col_u2:
-                total_impact = sum(c.people_affected for c in user_cases)
                 st.metric("People Impacted", f"{total_impact:,}")
             with col_u3:
-                resolved = len([c for c in user_cases if c.status == "resolved"])
                 st.metric("Cases Resolved", resolved)
         else:
             st.info("Take on cases to build your impact profile!")
@@ -697,16 +1862,15 @@ with tab4:  # Impact Tracker
     # Global Impact Map
     st.markdown("### 🌍 Global Human Rights & AI Landscape")
     
-    global_data = pd.DataFrame({
-        'Region': ['North America', 'Europe', 'Asia', 'Africa', 'South America'],
-        'Active Cases': [25, 32, 45, 18, 22],
-        'Most Violated Right': ['Privacy', 'Non-discrimination', 'Expression', 'Health', 'Work'],
-        'Advocacy Success Rate': ['65%', '72%', '45%', '58%', '62%']
-    })
+    global_data = get_ingestion_pipeline().store.region_summary()
     
-    st.dataframe(global_data, use_container_width=True)
+    if global_data:
+        st.dataframe(global_data, use_container_width=True)
+        st.caption(SUCCESS_RATE_NOTE)
+    else:
+        st.caption("Regional figures appear once violation reports are ingested.")
 
-with tab5:  # Human-Centered AI Chat
+def render_chat():  # Human-Centered AI Chat
     st.subheader("💬 Human-Centered AI Advisory Chat")
     
     st.markdown("""
@@ -811,6 +1975,130 @@ with tab5:  # Human-Centered AI Chat
                 
                 st.rerun()
 
+# Restore the state of a reconnected session before anything renders
+restore_session_snapshot()
+
+# Sidebar
+with st.sidebar:
+    st.markdown('<div class="human-card">', unsafe_allow_html=True)
+    st.title("🤝 Human AI Advocate")
+    st.markdown("Protecting human dignity in the age of AI")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Quick Stats
+    st.subheader("📊 Human Impact Stats")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Cases Active", len(st.session_state.advocacy_cases))
+    with col2:
+        st.metric("People Protected", st.session_state.impact_metrics['people_protected'])
+    
+    st.markdown("---")
+    
+    # Report New Issue
+    st.subheader("🚨 Report New Issue")
+    
+    if st.button("📝 Report Human Rights Violation", use_container_width=True):
+        st.session_state.reporting_mode = True
+        st.rerun()
+    
+    if st.session_state.get('reporting_mode'):
+        with st.form("violation_report"):
+            report_right = st.selectbox("Human Right", HUMAN_RIGHTS)
+            report_system = st.selectbox("AI System", AI_SYSTEMS)
+            report_region = st.text_input("Region")
+            report_evidence = st.selectbox("Evidence Level", EVIDENCE_LEVELS)
+            report_description = st.text_area("What happened?")
+            submitted = st.form_submit_button("Submit Report")
+        
+        if submitted:
+            report = {
+                "right": report_right,
+                "ai_system": report_system,
+                "region": report_region,
+                "evidence_level": report_evidence,
+                "description": report_description
+            }
+            try:
+                parse_violation_report(report)
+            except ValueError as exc:
+                st.error(f"Incomplete report: {exc}")
+            else:
+                if get_ingestion_pipeline().submit(report):
+                    st.session_state.reporting_mode = False
+                    st.success("Report received!")
+                else:
+                    st.warning("Too many reports are being processed. Please try again shortly.")
+    
+    if st.button("🆕 Generate Test Case", use_container_width=True):
+        # Generate a test case, based on a recent active violation report
+        # when there is one
+        case_id = f"HUM-{len(st.session_state.advocacy_cases) + 1000}"
+        store = get_ingestion_pipeline().store
+        active_reports = [v for v in store.recent() if v.status == "active"]
+        violation = random.choice(active_reports) if active_reports else None
+        rights = violation.right if violation else random.choice(HUMAN_RIGHTS)
+        systems = violation.ai_system if violation else random.choice(AI_SYSTEMS)
+        
+        test_cases = [
+            f"Discriminatory {systems} affecting {rights}",
+            f"Privacy violation by {systems}",
+            f"Lack of transparency in {systems} impacting {rights}",
+            f"Algorithmic bias in {systems} violating {rights}"
+        ]
+        
+        new_case = HumanAdvocacyCase(
+            case_id=case_id,
+            title=random.choice(test_cases),
+            description=f"Documented case where {systems} system is negatively impacting {rights}. Evidence shows systematic violation affecting vulnerable populations.",
+            human_right_affected=rights,
+            ai_system=systems,
+            severity=random.choice(["critical", "high", "medium", "low"])
+        )
+        if violation:
+            new_case.violation_id = violation.id
+            store.link_case(violation.id, case_id)
+        
+        st.session_state.advocacy_cases.append(new_case)
+        st.success("Test case generated!")
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # User Role
+    st.subheader("👤 Your Role")
+    user_role = st.selectbox(
+        "Select your advocacy role:",
+        ["Human Rights Advocate", "Legal Expert", "Policy Maker", 
+         "Affected Individual", "Researcher", "Concerned Citizen"]
+    )
+    
+    st.info(f"Role: {user_role}")
+
+# Main App
+st.markdown('<h1 style="text-align: center; color: #1a73e8;">🤝 Human AI Advocate Platform</h1>', unsafe_allow_html=True)
+st.markdown('<p style="text-align: center; font-size: 1.2rem;">Protecting Human Dignity in Artificial Intelligence Systems</p>', unsafe_allow_html=True)
+
+record_startup_timings()
+
+# View Navigation
+# Only the selected view runs on each rerun (unlike st.tabs, which executes
+# every tab), so heavy imports and reference data load on demand.
+VIEWS = {
+    "🏠 Dashboard": lambda: render_dashboard(),
+    "🔍 Cases": lambda: render_cases(user_role),
+    "⚖️ Advocacy Toolkit": lambda: render_advocacy_toolkit(),
+    "📈 Impact Tracker": lambda: render_impact_tracker(user_role),
+    "💬 Human-Centered AI Chat": lambda: render_chat()
+}
+
+active_view = st.radio("View", list(VIEWS.keys()), horizontal=True,
+                       label_visibility="collapsed", key="active_view")
+VIEWS[active_view]()
+
 # Footer
 st.markdown("---")
 st.markdown(
@@ -825,6 +2113,9 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# Snapshot the session if this run changed its state
+snapshot_session()
+
 # Real-time updates
 if st.checkbox("🔄 Enable live updates", value=False):
     st.info("Live updates enabled - monitoring human rights developments...")
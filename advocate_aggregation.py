@@ -0,0 +1,71 @@
+# Sharded aggregation for the Impact Tracker.
+# The case list only ever grows, so it is cut into fixed-size shards in
+# report order. Each shard's partial aggregates are cached under a
+# fingerprint of its case versions: older shards are reused until one of
+# their cases changes, and usually only the newest shard is recomputed.
+# Kept free of Streamlit so it can be tested and benchmarked on its own.
+from collections import Counter
+from operator import attrgetter
+from typing import Dict, List
+
+SHARD_SIZE = 50_000
+
+
+def case_row(case) -> tuple:
+    return (case.human_right_affected, case.ai_system, case.people_affected,
+            case.assigned_advocate, case.status)
+
+
+def aggregate_shard(rows: List[tuple]) -> Dict:
+    # rows: (human_right, ai_system, people_affected, assigned_advocate, status)
+    people_by_right = Counter()
+    cases_by_system = Counter()
+    advocates = {}  # advocate -> [cases, people affected, resolved]
+    for right, system, people, advocate, status in rows:
+        people_by_right[right] += people
+        cases_by_system[system] += 1
+        if advocate:
+            totals = advocates.setdefault(advocate, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += people
+            totals[2] += status == "resolved"
+    return {
+        "people_by_right": dict(people_by_right),
+        "cases_by_system": dict(cases_by_system),
+        "advocates": advocates
+    }
+
+
+def merge_aggregates(partials: List[Dict]) -> Dict:
+    people_by_right = Counter()
+    cases_by_system = Counter()
+    advocates = {}
+    for partial in partials:
+        people_by_right.update(partial["people_by_right"])
+        cases_by_system.update(partial["cases_by_system"])
+        for advocate, totals in partial["advocates"].items():
+            merged = advocates.setdefault(advocate, [0, 0, 0])
+            for i, value in enumerate(totals):
+                merged[i] += value
+    return {
+        "people_by_right": dict(people_by_right),
+        "cases_by_system": dict(cases_by_system),
+        "advocates": advocates
+    }
+
+
+def aggregate_cases(cases: List, cache: Dict, shard_size: int = SHARD_SIZE) -> Dict:
+    # cache: shard index -> (fingerprint, partial), updated in place
+    shard_count = (len(cases) + shard_size - 1) // shard_size
+    partials = []
+    for index in range(shard_count):
+        shard = cases[index * shard_size:(index + 1) * shard_size]
+        # Versions only increase, so any mutation changes the sum
+        fingerprint = (len(shard), sum(map(attrgetter("version"), shard)))
+        cached = cache.get(index)
+        if not cached or cached[0] != fingerprint:
+            cached = cache[index] = (fingerprint, aggregate_shard([case_row(c) for c in shard]))
+        partials.append(cached[1])
+    for index in [i for i in cache if i >= shard_count]:
+        del cache[index]
+    return merge_aggregates(partials)
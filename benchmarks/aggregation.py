@@ -0,0 +1,43 @@
+# Impact Tracker aggregation timings.
+#
+#   python benchmarks/aggregation.py [cases]
+#
+# Compares a full in-process aggregation, a rerun that recomputes only one
+# changed shard, and the pickle round trip of every row, which is the least
+# a worker process pool would add before doing any work.
+import os
+import pickle
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advocate_aggregation import aggregate_cases, case_row
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28}{time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(count):
+    cases = [SimpleNamespace(human_right_affected=f"right-{i % 20}", ai_system=f"system-{i % 12}",
+                             people_affected=i % 5000, assigned_advocate=f"advocate-{i % 50}",
+                             status="resolved" if i % 4 == 0 else "reported", version=0)
+             for i in range(count)]
+    print(f"{count:,} cases")
+    cache = {}
+    timed("full aggregation", lambda: aggregate_cases(cases, cache))
+    timed("unchanged rerun", lambda: aggregate_cases(cases, cache))
+    cases[-1].version += 1
+    timed("rerun, one shard changed", lambda: aggregate_cases(cases, cache))
+    rows = timed("build rows", lambda: [case_row(c) for c in cases])
+    data = timed("pickle rows", lambda: pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+    timed("unpickle rows", lambda: pickle.loads(data))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
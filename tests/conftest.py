@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "advocate.py")
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    # The app is a Streamlit script, so its classes and functions are only
+    # defined while it runs; AppTest installs the executed script as __main__
+    pytest.importorskip("streamlit")
+    from streamlit.testing.v1 import AppTest
+
+    workdir = tmp_path_factory.mktemp("app")
+    saved = {name: os.environ.get(name) for name in ("ADVOCATE_FEED_DIR", "ADVOCATE_SNAPSHOT_DIR")}
+    os.environ["ADVOCATE_FEED_DIR"] = str(workdir / "feed")
+    os.environ["ADVOCATE_SNAPSHOT_DIR"] = str(workdir / "snapshots")
+    main = sys.modules["__main__"]
+    try:
+        at = AppTest.from_file(APP, default_timeout=30)
+        at.run()
+        assert not at.exception
+        module = sys.modules["__main__"]
+    finally:
+        sys.modules["__main__"] = main
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    return module
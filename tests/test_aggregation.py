@@ -0,0 +1,36 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advocate_aggregation import aggregate_cases, aggregate_shard, case_row
+
+
+def make_cases(count):
+    return [SimpleNamespace(human_right_affected=f"right-{i % 3}", ai_system=f"system-{i % 4}",
+                            people_affected=i, assigned_advocate="ana" if i % 2 else "",
+                            status="resolved" if i % 5 == 0 else "reported", version=0)
+            for i in range(count)]
+
+
+def test_sharded_totals_match_a_single_pass():
+    cases = make_cases(103)
+    expected = aggregate_shard([case_row(c) for c in cases])
+    assert aggregate_cases(cases, {}, shard_size=10) == expected
+
+
+def test_only_changed_and_new_shards_are_recomputed():
+    cases = make_cases(30)
+    cache = {}
+    aggregate_cases(cases, cache, shard_size=10)
+    before = {index: entry[1] for index, entry in cache.items()}
+
+    cases[15].status, cases[15].version = "resolved", 1
+    cases += make_cases(5)
+    totals = aggregate_cases(cases, cache, shard_size=10)
+
+    assert cache[0][1] is before[0] and cache[2][1] is before[2]
+    assert cache[1][1] is not before[1]
+    assert sorted(cache) == [0, 1, 2, 3]
+    assert totals == aggregate_shard([case_row(c) for c in cases])
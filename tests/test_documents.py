@@ -0,0 +1,42 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "advocate.py")
+TOOLKIT = "⚖️ Advocacy Toolkit"
+
+
+def test_repeated_request_while_rendering_is_listed_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADVOCATE_FEED_DIR", str(tmp_path / "feed"))
+    monkeypatch.setenv("ADVOCATE_SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state["active_view"] = TOOLKIT
+    at.run()
+
+    # Occupy every document worker so the request stays queued
+    generator = sys.modules["__main__"].get_document_generator()
+    release = threading.Event()
+    blockers = [generator._executor.submit(release.wait) for _ in range(generator._executor._max_workers)]
+    generate = next(b for b in at.button if "Generate Advocacy Plan" in b.label)
+    generate.click().run()
+    generate.click().run()
+    release.set()
+    for blocker in blockers:
+        blocker.result(timeout=10)
+
+    jobs = at.session_state.document_jobs
+    assert len(jobs) == 1
+    deadline = time.monotonic() + 10
+    while not jobs[0].finished and time.monotonic() < deadline:
+        time.sleep(0.05)
+    at.run()
+    assert not at.exception
+    assert len(at.get("download_button")) == 1
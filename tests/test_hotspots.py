@@ -0,0 +1,75 @@
+import datetime
+
+
+def make_violation(app, violation_id, region="EU", right="Right to Privacy", hours_ago=0.0):
+    violation = app.HumanRightsViolation(violation_id, right, "Facial Recognition",
+                                         "Camera network tracks protesters", region, "documented")
+    violation.reported_date = datetime.datetime.now() - datetime.timedelta(hours=hours_ago)
+    return violation
+
+
+def stats_row(index, region):
+    return next(row for row in index.summary() if row["Region"] == region)
+
+
+def test_region_index_tracks_resolve_and_reopen(app):
+    index = app.RegionIndex()
+    first, second = make_violation(app, "V-1"), make_violation(app, "V-2", right="Right to Work")
+    index.add(first)
+    index.add(second)
+    assert stats_row(index, "EU")["Active Violations"] == 2
+    assert stats_row(index, "EU")["Advocacy Success Rate"] == "-"
+
+    first.related_cases.append("HUM-1000")
+    index.link(first)
+    assert stats_row(index, "EU")["Advocacy Success Rate"] == "0%"
+
+    index.resolve(first)
+    row = stats_row(index, "EU")
+    assert row["Active Violations"] == 1
+    assert row["Most Affected Right"] == "Right to Work"
+    assert row["Advocacy Success Rate"] == "100%"
+
+    index.reopen(first)
+    stats = index.regions["EU"]
+    assert (stats.active, stats.active_rights["Right to Privacy"], stats.resolved) == (2, 1, 0)
+    assert stats_row(index, "EU")["Advocacy Success Rate"] == "0%"
+
+
+def test_hotspots_count_only_reports_inside_the_window(app):
+    index = app.RegionIndex(window=datetime.timedelta(hours=24))
+    for i in range(3):
+        index.add(make_violation(app, f"EU-{i}", region="EU", hours_ago=1))
+    for i in range(2):
+        index.add(make_violation(app, f"US-{i}", region="USA", hours_ago=2))
+    for i in range(5):
+        index.add(make_violation(app, f"IN-{i}", region="India", hours_ago=48))
+
+    hotspots = index.hotspots(k=5)
+    assert [row["Region"] for row in hotspots] == ["EU", "USA"]
+    assert [row["Reports (24h)"] for row in hotspots] == [3, 2]
+    assert index.hotspots(k=1)[0]["Region"] == "EU"
+    # Reports age out as the window moves on
+    later = datetime.datetime.now() + datetime.timedelta(hours=25)
+    assert index.hotspots(k=5, now=later) == []
+
+
+def test_reopening_a_linked_case_reactivates_its_violation(app):
+    store = app.ViolationStore()
+    violation = make_violation(app, "V-1")
+    store.add_batch([violation])
+    store.link_case("V-1", "HUM-1000")
+    store.link_case("V-1", "HUM-1001")
+
+    store.resolve_violation("V-1", "HUM-1000")
+    store.resolve_violation("V-1", "HUM-1001")
+    store.reopen_violation("V-1", "HUM-1000")
+    assert violation.status == "resolved"
+    store.reopen_violation("V-1", "HUM-1001")
+    assert violation.status == "active"
+    assert store.region_summary()[0]["Active Violations"] == 1
+
+    # A case that never resolved it does not reopen a violation
+    store.resolve_violation("V-1", "HUM-1000")
+    store.reopen_violation("V-1", "HUM-1001")
+    assert violation.status == "resolved"
@@ -0,0 +1,99 @@
+import json
+import os
+import time
+
+import pytest
+
+
+def report(**overrides):
+    record = {"right": "Right to Privacy", "ai_system": "Facial Recognition",
+              "description": "Camera network tracks protesters", "region": "EU"}
+    record.update(overrides)
+    return record
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_parser_accepts_a_valid_report(app):
+    violation = app.parse_violation_report(report(reported_date="2024-05-01T12:00:00+00:00"))
+    assert violation.region == "EU" and violation.reported_date.tzinfo is None
+
+
+@pytest.mark.parametrize("overrides", [
+    {"right": "Right to Nothing"},
+    {"ai_system": "<img src=x onerror=alert(1)>"},
+    {"region": "  "},
+    {"status": "pending"},
+    {"reported_date": "not a date"},
+    {"reported_date": "0001-01-01"},
+])
+def test_parser_rejects_invalid_reports(app, overrides):
+    with pytest.raises(ValueError):
+        app.parse_violation_report(report(**overrides))
+
+
+@pytest.fixture
+def pipeline(app, tmp_path):
+    pipeline = app.ViolationIngestionPipeline(app.ViolationStore(), feed_dir=str(tmp_path), quiet_period=0)
+    yield pipeline
+    pipeline.stop()
+
+
+def test_pipeline_skips_bad_reports_and_keeps_ingesting(pipeline, tmp_path):
+    lines = [report(id="V-1", reported_date="0001-01-01"), report(id="V-2"), "{not json"]
+    (tmp_path / "feed.jsonl").write_text(
+        "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n")
+    pipeline.start()
+
+    store = pipeline.store
+    assert wait_for(lambda: store.ingested == 1 and store.rejected == 2)
+    assert list(store.violations) == ["V-2"]
+    assert store.region_summary()[0]["Active Violations"] == 1
+    assert (tmp_path / "feed.jsonl.done").exists()
+
+
+def test_writer_survives_a_failing_batch(pipeline):
+    store = pipeline.store
+    add_batch = store.add_batch
+    calls = []
+
+    def flaky_add_batch(batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return add_batch(batch)
+
+    store.add_batch = flaky_add_batch
+    pipeline.start()
+    assert pipeline.submit(report(id="V-1"))
+    assert wait_for(lambda: store.rejected == 1)
+    assert pipeline.submit(report(id="V-2"))
+    assert wait_for(lambda: store.ingested == 1)
+    assert list(store.violations) == ["V-2"]
+
+
+def test_reader_waits_for_a_file_to_stop_changing(app, tmp_path):
+    pipeline = app.ViolationIngestionPipeline(app.ViolationStore(), feed_dir=str(tmp_path), quiet_period=60)
+    feed = tmp_path / "feed.jsonl"
+    complete, partial = json.dumps(report(id="V-1")), json.dumps(report(id="V-2"))
+    feed.write_text(complete + "\n" + partial[:20])
+    pipeline.start()
+    try:
+        time.sleep(0.5)
+        assert pipeline.store.ingested == 0 and feed.exists()
+
+        feed.write_text(complete + "\n" + partial + "\n")
+        settled = time.time() - 120
+        os.utime(feed, (settled, settled))
+        store = pipeline.store
+        assert wait_for(lambda: store.ingested == 2)
+        assert store.rejected == 0
+    finally:
+        pipeline.stop()
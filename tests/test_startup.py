@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "advocate.py")
+HEAVY_MODULES = ["pandas", "numpy", "plotly"]
+
+# Runs in a fresh interpreter so nothing is already cached in sys.modules
+PROBE = '''
+import ast, importlib, json, sys, time
+
+app = sys.argv[1]
+sys.path.insert(0, __import__("os").path.dirname(app))
+with open(app, encoding="utf-8") as handle:
+    tree = ast.parse(handle.read())
+modules = []
+for node in tree.body:
+    if isinstance(node, ast.Import):
+        modules += [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom):
+        modules.append(node.module)
+
+start = time.perf_counter()
+import streamlit
+# streamlit itself may pull some heavy modules in; only the app's additions count
+preloaded = set(sys.modules)
+for name in modules:
+    importlib.import_module(name)
+import_time = time.perf_counter() - start
+
+from streamlit.testing.v1 import AppTest
+
+at = AppTest.from_file(app, default_timeout=30)
+at.session_state["active_view"] = "\\U0001f4ac Human-Centered AI Chat"
+at.run()
+at.button(key="qq_0").click()
+at.run()
+
+print(json.dumps({
+    "import": import_time,
+    "first_paint": at.session_state.startup_timings["first_paint"],
+    "budget": at.session_state.startup_budget,
+    "exceptions": [e.value for e in at.exception],
+    "loaded": [name for name in %r if name in sys.modules and name not in preloaded]
+}))
+''' % HEAVY_MODULES
+
+
+@pytest.fixture(scope="module")
+def startup(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("startup")
+    env = dict(os.environ,
+               ADVOCATE_FEED_DIR=str(workdir / "feed"),
+               ADVOCATE_SNAPSHOT_DIR=str(workdir / "snapshots"))
+    result = subprocess.run([sys.executable, "-c", PROBE, APP], cwd=workdir, env=env,
+                            capture_output=True, text=True, timeout=120, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_sidebar_and_chat_render_without_errors(startup):
+    assert startup["exceptions"] == []
+
+
+def test_import_time_within_budget(startup):
+    assert startup["import"] <= startup["budget"]["import"]
+
+
+def test_first_paint_within_budget(startup):
+    assert startup["first_paint"] <= startup["budget"]["first_paint"]
+
+
+def test_heavy_modules_not_loaded_for_sidebar_and_chat(startup):
+    assert startup["loaded"] == []